@@ -1,4 +1,6 @@
 import json
+import os
+from functools import lru_cache
 from typing import Any, Dict, List, Union
 
 import logging
@@ -6,9 +8,19 @@ import logging
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=128)
+def _load_config_file(json_file_path: str, mtime: float) -> Dict:
+    """Parses a json config file. Results are cached by path and modification time,
+    so the returned dict is shared between callers and must not be mutated."""
+    with open(json_file_path, "r") as config_file:
+        return json.load(config_file)
+
+
 class BaseConfig:
     """Used for parsing, validating, and storing information about the labeling task passed to the LabelingAgent. Additional config classes should extend from this base class."""
 
+    __slots__ = ("config",)
+
     def __init__(self, config: Union[str, Dict], validate: bool = True) -> None:
         if isinstance(config, str):
             self.config = self._safe_load_json(config)
@@ -20,8 +32,9 @@ class BaseConfig:
     def _safe_load_json(self, json_file_path: str) -> Dict:
         """Loads config settings from a provided json file"""
         try:
-            with open(json_file_path, "r") as config_file:
-                return json.load(config_file)
+            return _load_config_file(
+                os.path.abspath(json_file_path), os.path.getmtime(json_file_path)
+            )
         except ValueError as e:
             logger.error(
                 f"JSON file: {json_file_path} not loaded successfully. Error: {repr(e)}"
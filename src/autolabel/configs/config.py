@@ -1,298 +1,510 @@
-from functools import cached_property
-from typing import Dict, List, Union
+from __future__ import annotations
 
-from jsonschema import validate
+import os
+import threading
+from functools import cache, lru_cache
+from typing import Any, Callable, Dict, Final, List, Optional, Type, Union
+
+from jsonschema.exceptions import best_match
+from jsonschema.protocols import Validator
+from jsonschema.validators import validator_for
 
 from .base import BaseConfig
 
+try:
+    import jsonschema_rs
+except ImportError:
+    jsonschema_rs = None
+
+try:
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
+
+
+# Defaults for string-valued dataset and chunking settings
+_DEFAULT_LABEL_SEPARATOR: Final = ";"
+_DEFAULT_DELIMITER: Final = ","
+_DEFAULT_CONFIDENCE_MERGE_FUNCTION: Final = "max"
+
+# Config dicts that have already passed validation, keyed by id(). The dict is
+# stored alongside its id so that the id cannot be reused by another object
+# while the entry is alive. This keeps strong references to up to
+# _MAX_VALIDATED_CONFIGS config dicts (including any inline few-shot examples)
+# for the lifetime of the process. Mutating a config dict after it has been
+# validated is not supported and may skip revalidation.
+_VALIDATED_CONFIGS: Dict[int, Dict] = {}
+_MAX_VALIDATED_CONFIGS: Final = 128
+_VALIDATED_CONFIGS_LOCK = threading.Lock()
+
+
+def _is_validated(config: Dict) -> bool:
+    return _VALIDATED_CONFIGS.get(id(config)) is config
+
+
+def _mark_validated(config: Dict) -> None:
+    # Configs may be built concurrently, so eviction and insertion happen under a lock
+    with _VALIDATED_CONFIGS_LOCK:
+        if len(_VALIDATED_CONFIGS) >= _MAX_VALIDATED_CONFIGS:
+            _VALIDATED_CONFIGS.pop(next(iter(_VALIDATED_CONFIGS), None), None)
+        _VALIDATED_CONFIGS[id(config)] = config
+
+
+@cache
+def _get_schema() -> Dict:
+    """Returns the config schema. The import is deferred until first use because
+    autolabel.configs.schema imports autolabel.schema, which imports this package."""
+    from autolabel.configs.schema import schema
+
+    return schema
+
+
+@cache
+def _get_native_validator() -> jsonschema_rs.Validator:
+    """Builds the Rust-backed validator for the config schema once per process"""
+    return jsonschema_rs.validator_for(_get_schema())
+
+
+@cache
+def _get_compiled_validator() -> Callable[[Dict], Dict]:
+    """Compiles the config schema into a validator function once per process"""
+    return fastjsonschema.compile(_get_schema(), use_default=False)
+
+
+@lru_cache(maxsize=1)
+def _schema_validator() -> Validator:
+    """Builds the jsonschema validator for the config schema once per process"""
+    schema = _get_schema()
+    validator_cls = validator_for(schema)
+    validator_cls.check_schema(schema)
+    return validator_cls(schema)
+
+
+def _contains_tuple(value: Any) -> bool:
+    if isinstance(value, tuple):
+        return True
+    if isinstance(value, dict):
+        return any(_contains_tuple(v) for v in value.values())
+    if isinstance(value, list):
+        return any(_contains_tuple(v) for v in value)
+    return False
+
+
+def _accepted_by_fast_validator(config: Dict) -> bool:
+    """Returns true if an optional fast validator accepts the config. A rejection is
+    not final, since the fast validators handle some non-json types (e.g. numpy
+    scalars) differently from jsonschema. They also accept tuples as arrays, which
+    jsonschema rejects, so configs containing tuples are never accepted here."""
+    if jsonschema_rs is None and fastjsonschema is None:
+        return False
+    if _contains_tuple(config):
+        return False
+
+    if jsonschema_rs is not None:
+        try:
+            _get_native_validator().validate(config)
+        except ValueError:
+            # jsonschema_rs.ValidationError and unsupported value types
+            return False
+        return True
+
+    try:
+        _get_compiled_validator()(config)
+    except fastjsonschema.JsonSchemaException:
+        return False
+    return True
+
+
+def _validate_config(config: Dict) -> None:
+    """Validates a config dict against the config schema. Configs accepted by an
+    optional fast validator are not checked again, all others are checked with
+    jsonschema, which decides the outcome and reports the error. Validation is
+    skipped for a config dict that has already been validated."""
+    if _is_validated(config):
+        return
+
+    if not _accepted_by_fast_validator(config):
+        error = best_match(_schema_validator().iter_errors(config))
+        if error is not None:
+            raise error
+
+    _mark_validated(config)
+
+
+@lru_cache(maxsize=32)
+def _config_from_path(
+    config_cls: Type[AutolabelConfig], path: str, mtime: float
+) -> AutolabelConfig:
+    return config_cls(path)
+
 
 class AutolabelConfig(BaseConfig):
     """Class to parse and store configs passed to Autolabel agent."""
 
+    __slots__ = (
+        "_dataset_config",
+        "_model_config",
+        "_embedding_config",
+        "_prompt_config",
+        "_dataset_generation_config",
+        "_chunking_config",
+        "_flat",
+    )
+
     # Top-level config keys
-    TASK_NAME_KEY = "task_name"
-    TASK_TYPE_KEY = "task_type"
-    DATASET_CONFIG_KEY = "dataset"
-    MODEL_CONFIG_KEY = "model"
-    EMBEDDING_CONFIG_KEY = "embedding"
-    PROMPT_CONFIG_KEY = "prompt"
-    DATASET_GENERATION_CONFIG_KEY = "dataset_generation"
-    CHUNKING_CONFIG_KEY = "chunking"
+    TASK_NAME_KEY: Final = "task_name"
+    TASK_TYPE_KEY: Final = "task_type"
+    DATASET_CONFIG_KEY: Final = "dataset"
+    MODEL_CONFIG_KEY: Final = "model"
+    EMBEDDING_CONFIG_KEY: Final = "embedding"
+    PROMPT_CONFIG_KEY: Final = "prompt"
+    DATASET_GENERATION_CONFIG_KEY: Final = "dataset_generation"
+    CHUNKING_CONFIG_KEY: Final = "chunking"
 
     # Dataset config keys (config["dataset"][<key>])
-    LABEL_COLUMN_KEY = "label_column"
-    LABEL_SEPARATOR_KEY = "label_separator"
-    EXPLANATION_COLUMN_KEY = "explanation_column"
-    IMAGE_COLUMNS_KEY = "image_url_columns"
-    TEXT_COLUMN_KEY = "text_column"
-    INPUT_COLUMNS_KEY = "input_columns"
-    OUTPUT_COLUMNS_KEY = "output_columns"
-    DELIMITER_KEY = "delimiter"
-    DISABLE_QUOTING = "disable_quoting"
+    LABEL_COLUMN_KEY: Final = "label_column"
+    LABEL_SEPARATOR_KEY: Final = "label_separator"
+    EXPLANATION_COLUMN_KEY: Final = "explanation_column"
+    IMAGE_COLUMNS_KEY: Final = "image_url_columns"
+    TEXT_COLUMN_KEY: Final = "text_column"
+    INPUT_COLUMNS_KEY: Final = "input_columns"
+    OUTPUT_COLUMNS_KEY: Final = "output_columns"
+    DELIMITER_KEY: Final = "delimiter"
+    DISABLE_QUOTING: Final = "disable_quoting"
 
     # Model config keys (config["model"][<key>])
-    PROVIDER_KEY = "provider"
-    MODEL_NAME_KEY = "name"
-    MODEL_PARAMS_KEY = "params"
-    MODEL_ENDPOINT_KEY = "endpoint"
-    COMPUTE_CONFIDENCE_KEY = "compute_confidence"
-    LOGIT_BIAS_KEY = "logit_bias"
-    JSON_MODE = "json_mode"
+    PROVIDER_KEY: Final = "provider"
+    MODEL_NAME_KEY: Final = "name"
+    MODEL_PARAMS_KEY: Final = "params"
+    MODEL_ENDPOINT_KEY: Final = "endpoint"
+    COMPUTE_CONFIDENCE_KEY: Final = "compute_confidence"
+    LOGIT_BIAS_KEY: Final = "logit_bias"
+    JSON_MODE: Final = "json_mode"
 
     # Embedding config keys (config["embedding"][<key>])
-    EMBEDDING_PROVIDER_KEY = "provider"
-    EMBEDDING_MODEL_NAME_KEY = "model"
+    EMBEDDING_PROVIDER_KEY: Final = "provider"
+    EMBEDDING_MODEL_NAME_KEY: Final = "model"
 
     # Prompt config keys (config["prompt"][<key>])
-    TASK_GUIDELINE_KEY = "task_guidelines"
-    VALID_LABELS_KEY = "labels"
-    FEW_SHOT_EXAMPLE_SET_KEY = "few_shot_examples"
-    FEW_SHOT_SELECTION_ALGORITHM_KEY = "few_shot_selection"
-    FEW_SHOT_NUM_KEY = "few_shot_num"
-    VECTOR_STORE_PARAMS_KEY = "vector_store_params"
-    EXAMPLE_TEMPLATE_KEY = "example_template"
-    OUTPUT_GUIDELINE_KEY = "output_guidelines"
-    OUTPUT_FORMAT_KEY = "output_format"
-    CHAIN_OF_THOUGHT_KEY = "chain_of_thought"
-    LABEL_SELECTION_KEY = "label_selection"
-    LABEL_SELECTION_COUNT_KEY = "label_selection_count"
-    LABEL_SELECTION_THRESHOLD = "label_selection_threshold"
-    ATTRIBUTES_KEY = "attributes"
-    TRANSFORM_KEY = "transforms"
+    TASK_GUIDELINE_KEY: Final = "task_guidelines"
+    VALID_LABELS_KEY: Final = "labels"
+    FEW_SHOT_EXAMPLE_SET_KEY: Final = "few_shot_examples"
+    FEW_SHOT_SELECTION_ALGORITHM_KEY: Final = "few_shot_selection"
+    FEW_SHOT_NUM_KEY: Final = "few_shot_num"
+    VECTOR_STORE_PARAMS_KEY: Final = "vector_store_params"
+    EXAMPLE_TEMPLATE_KEY: Final = "example_template"
+    OUTPUT_GUIDELINE_KEY: Final = "output_guidelines"
+    OUTPUT_FORMAT_KEY: Final = "output_format"
+    CHAIN_OF_THOUGHT_KEY: Final = "chain_of_thought"
+    LABEL_SELECTION_KEY: Final = "label_selection"
+    LABEL_SELECTION_COUNT_KEY: Final = "label_selection_count"
+    LABEL_SELECTION_THRESHOLD: Final = "label_selection_threshold"
+    ATTRIBUTES_KEY: Final = "attributes"
+    TRANSFORM_KEY: Final = "transforms"
 
     # Dataset generation config keys (config["dataset_generation"][<key>])
-    DATASET_GENERATION_GUIDELINES_KEY = "guidelines"
-    DATASET_GENERATION_NUM_ROWS_KEY = "num_rows"
+    DATASET_GENERATION_GUIDELINES_KEY: Final = "guidelines"
+    DATASET_GENERATION_NUM_ROWS_KEY: Final = "num_rows"
 
     # Chunking config keys (config["chunking"][<key>])
-    CONFIDENCE_CHUNK_COLUMN_KEY = "confidence_chunk_column"
-    CONFIDENCE_CHUNK_SIZE_KEY = "confidence_chunk_size"
-    CONFIDENCE_MERGE_FUNCTION_KEY = "confidence_merge_function"
+    CONFIDENCE_CHUNK_COLUMN_KEY: Final = "confidence_chunk_column"
+    CONFIDENCE_CHUNK_SIZE_KEY: Final = "confidence_chunk_size"
+    CONFIDENCE_MERGE_FUNCTION_KEY: Final = "confidence_merge_function"
 
     def __init__(self, config: Union[str, Dict], validate: bool = True) -> None:
         super().__init__(config, validate=validate)
+        # Information about the dataset being used for labeling (e.g. label_column, text_column, delimiter)
+        self._dataset_config: Dict = self.config.get(self.DATASET_CONFIG_KEY, {})
+        # Information about the model being used for labeling (e.g. provider name, model name, parameters)
+        self._model_config: Dict = self.config.get(self.MODEL_CONFIG_KEY, {})
+        # Information about the model being used for computing embeddings (e.g. provider name, model name)
+        self._embedding_config: Dict = self.config.get(self.EMBEDDING_CONFIG_KEY, {})
+        # Information about the prompt we are passing to the model (e.g. task guidelines, examples, output formatting)
+        self._prompt_config: Dict = self.config.get(self.PROMPT_CONFIG_KEY, {})
+        # Information about the prompt for synthetic dataset generation
+        self._dataset_generation_config: Dict = self.config.get(
+            self.DATASET_GENERATION_CONFIG_KEY, {}
+        )
+        # Information about the chunking config
+        self._chunking_config: Dict = self.config.get(self.CHUNKING_CONFIG_KEY, {})
+        # Default-resolved value of every getter, keyed by getter name
+        self._flat: Dict[str, Any] = self._materialize()
+
+    @classmethod
+    def from_path(cls, path: str, mtime: Optional[float] = None) -> AutolabelConfig:
+        """Returns a config loaded from the json file at path. Configs are cached by path
+        and modification time, so repeated calls for an unchanged file return the same
+        instance. The returned config is shared and must be treated as immutable."""
+        path = os.path.abspath(path)
+        if mtime is None:
+            mtime = os.path.getmtime(path)
+        return _config_from_path(cls, path, mtime)
 
     def _validate(self) -> bool:
         """Returns true if the config settings are valid"""
-        from autolabel.configs.schema import schema
-
-        validate(
-            instance=self.config,
-            schema=schema,
-        )
+        _validate_config(self.config)
         return True
 
-    @cached_property
-    def _dataset_config(self) -> Dict:
-        """Returns information about the dataset being used for labeling (e.g. label_column, text_column, delimiter)"""
-        return self.config.get(self.DATASET_CONFIG_KEY, {})
-
-    @cached_property
-    def _model_config(self) -> Dict:
-        """Returns information about the model being used for labeling (e.g. provider name, model name, parameters)"""
-        return self.config[self.MODEL_CONFIG_KEY]
-
-    @cached_property
-    def _embedding_config(self) -> Dict:
-        """Returns information about the model being used for computing embeddings (e.g. provider name, model name)"""
-        return self.config.get(self.EMBEDDING_CONFIG_KEY, {})
-
-    @cached_property
-    def _prompt_config(self) -> Dict:
-        """Returns information about the prompt we are passing to the model (e.g. task guidelines, examples, output formatting)"""
-        return self.config[self.PROMPT_CONFIG_KEY]
-
-    @cached_property
-    def _dataset_generation_config(self) -> Dict:
-        """Returns information about the prompt for synthetic dataset generation"""
-        return self.config.get(self.DATASET_GENERATION_CONFIG_KEY, {})
-
-    @cached_property
-    def _chunking_config(self) -> Dict:
-        """Returns information about the chunking config"""
-        return self.config.get(self.CHUNKING_CONFIG_KEY, {})
+    def _materialize(self) -> Dict[str, Any]:
+        """Resolves every getter value, including defaults, once at construction"""
+        dataset_config = self._dataset_config
+        model_config = self._model_config
+        embedding_config = self._embedding_config
+        prompt_config = self._prompt_config
+        dataset_generation_config = self._dataset_generation_config
+        chunking_config = self._chunking_config
+
+        valid_labels = prompt_config.get(self.VALID_LABELS_KEY, [])
+        if isinstance(valid_labels, dict):
+            labels_list, label_descriptions = list(valid_labels.keys()), valid_labels
+        else:
+            labels_list, label_descriptions = valid_labels, None
+
+        max_selected_labels = prompt_config.get(self.LABEL_SELECTION_COUNT_KEY, 10)
+        if max_selected_labels is not None and max_selected_labels < 1:
+            max_selected_labels = len(labels_list)
+
+        flat = {
+            "label_column": dataset_config.get(self.LABEL_COLUMN_KEY, None),
+            "label_separator": dataset_config.get(
+                self.LABEL_SEPARATOR_KEY, _DEFAULT_LABEL_SEPARATOR
+            ),
+            "text_column": dataset_config.get(self.TEXT_COLUMN_KEY, None),
+            "input_columns": dataset_config.get(self.INPUT_COLUMNS_KEY, []),
+            "output_columns": dataset_config.get(self.OUTPUT_COLUMNS_KEY, []),
+            "explanation_column": dataset_config.get(self.EXPLANATION_COLUMN_KEY, None),
+            "image_columns": dataset_config.get(self.IMAGE_COLUMNS_KEY, []),
+            "delimiter": dataset_config.get(self.DELIMITER_KEY, _DEFAULT_DELIMITER),
+            "disable_quoting": dataset_config.get(self.DISABLE_QUOTING, False),
+            "model_params": model_config.get(self.MODEL_PARAMS_KEY, {}),
+            "model_endpoint": model_config.get(self.MODEL_ENDPOINT_KEY, None),
+            "confidence": model_config.get(self.COMPUTE_CONFIDENCE_KEY, False),
+            "logit_bias": model_config.get(self.LOGIT_BIAS_KEY, 0.0),
+            "json_mode": model_config.get(self.JSON_MODE, False),
+            "embedding_provider": embedding_config.get(
+                self.EMBEDDING_PROVIDER_KEY, model_config.get(self.PROVIDER_KEY)
+            ),
+            "embedding_model_name": embedding_config.get(
+                self.EMBEDDING_MODEL_NAME_KEY, None
+            ),
+            "task_guidelines": prompt_config.get(self.TASK_GUIDELINE_KEY, ""),
+            "labels_list": labels_list,
+            "label_descriptions": label_descriptions,
+            "few_shot_example_set": prompt_config.get(
+                self.FEW_SHOT_EXAMPLE_SET_KEY, []
+            ),
+            "few_shot_algorithm": prompt_config.get(
+                self.FEW_SHOT_SELECTION_ALGORITHM_KEY, None
+            ),
+            "few_shot_num_examples": prompt_config.get(self.FEW_SHOT_NUM_KEY, 0),
+            "vector_store_params": prompt_config.get(self.VECTOR_STORE_PARAMS_KEY, {}),
+            "example_template": prompt_config.get(self.EXAMPLE_TEMPLATE_KEY, None),
+            "output_format": prompt_config.get(self.OUTPUT_FORMAT_KEY, None),
+            "output_guidelines": prompt_config.get(self.OUTPUT_GUIDELINE_KEY, None),
+            "chain_of_thought": prompt_config.get(self.CHAIN_OF_THOUGHT_KEY, False),
+            "label_selection": bool(prompt_config.get(self.LABEL_SELECTION_KEY, False)),
+            "max_selected_labels": max_selected_labels,
+            "label_selection_threshold": prompt_config.get(
+                self.LABEL_SELECTION_THRESHOLD, 0.0
+            ),
+            "attributes": prompt_config.get(self.ATTRIBUTES_KEY, []),
+            "transforms": self.config.get(self.TRANSFORM_KEY, []),
+            "dataset_generation_guidelines": dataset_generation_config.get(
+                self.DATASET_GENERATION_GUIDELINES_KEY, ""
+            ),
+            "dataset_generation_num_rows": dataset_generation_config.get(
+                self.DATASET_GENERATION_NUM_ROWS_KEY, 1
+            ),
+            "confidence_chunk_column": chunking_config.get(
+                self.CONFIDENCE_CHUNK_COLUMN_KEY
+            ),
+            "confidence_chunk_size": chunking_config.get(
+                self.CONFIDENCE_CHUNK_SIZE_KEY, 3400
+            ),
+            "confidence_merge_function": chunking_config.get(
+                self.CONFIDENCE_MERGE_FUNCTION_KEY, _DEFAULT_CONFIDENCE_MERGE_FUNCTION
+            ),
+        }
+        # Required settings are only copied when present so that their getters
+        # keep raising KeyError for configs that were not validated
+        for name, section, key in (
+            ("task_name", self.config, self.TASK_NAME_KEY),
+            ("task_type", self.config, self.TASK_TYPE_KEY),
+            ("provider", model_config, self.PROVIDER_KEY),
+            ("model_name", model_config, self.MODEL_NAME_KEY),
+        ):
+            if key in section:
+                flat[name] = section[key]
+        return flat
 
     # project and task definition config
     def task_name(self) -> str:
-        return self.config[self.TASK_NAME_KEY]
+        return self._flat["task_name"]
 
     def task_type(self) -> str:
         """Returns the type of task we have configured the labeler to perform (e.g. Classification, Question Answering)"""
-        return self.config[self.TASK_TYPE_KEY]
+        return self._flat["task_type"]
 
     # Dataset config
     def label_column(self) -> str:
         """Returns the name of the column containing labels for the dataset. Used for comparing accuracy of autolabel results vs ground truth"""
-        return self._dataset_config.get(self.LABEL_COLUMN_KEY, None)
+        return self._flat["label_column"]
 
     def label_separator(self) -> str:
         """Returns the token used to seperate multiple labels in the dataset. Defaults to a semicolon ';'"""
-        return self._dataset_config.get(self.LABEL_SEPARATOR_KEY, ";")
+        return self._flat["label_separator"]
 
     def text_column(self) -> str:
         """Returns the name of the column containing text data we intend to label"""
-        return self._dataset_config.get(self.TEXT_COLUMN_KEY, None)
+        return self._flat["text_column"]
 
     def input_columns(self) -> List[str]:
         """Returns the names of the input columns from the dataset that are used in the prompt"""
-        return self._dataset_config.get(self.INPUT_COLUMNS_KEY, [])
+        return self._flat["input_columns"]
 
     def output_columns(self) -> List[str]:
         """Returns the names of the expected output fields from the dataset"""
-        return self._dataset_config.get(self.OUTPUT_COLUMNS_KEY, [])
+        return self._flat["output_columns"]
 
     def explanation_column(self) -> str:
         """Returns the name of the column containing an explanation as to why the data is labeled a certain way"""
-        return self._dataset_config.get(self.EXPLANATION_COLUMN_KEY, None)
+        return self._flat["explanation_column"]
 
     def image_columns(self) -> List[str]:
         """Returns the names of the columns containing an image url for the given item"""
-        return self._dataset_config.get(self.IMAGE_COLUMNS_KEY, [])
+        return self._flat["image_columns"]
 
     def delimiter(self) -> str:
         """Returns the token used to seperate cells in the dataset. Defaults to a comma ','"""
-        return self._dataset_config.get(self.DELIMITER_KEY, ",")
+        return self._flat["delimiter"]
 
     def disable_quoting(self) -> bool:
         """Returns true if quoting is disabled. Defaults to false"""
-        return self._dataset_config.get(self.DISABLE_QUOTING, False)
+        return self._flat["disable_quoting"]
 
     # Model config
     def provider(self) -> str:
         """Returns the name of the entity that provides the currently configured model (e.g. OpenAI, Anthropic, Refuel)"""
-        return self._model_config[self.PROVIDER_KEY]
+        return self._flat["provider"]
 
     def model_name(self) -> str:
         """Returns the name of the model being used for labeling (e.g. gpt-4, claude-v1)"""
-        return self._model_config[self.MODEL_NAME_KEY]
+        return self._flat["model_name"]
 
     def model_params(self) -> Dict:
         """Returns a dict of configured settings for the model (e.g. hyperparameters)"""
-        return self._model_config.get(self.MODEL_PARAMS_KEY, {})
+        return self._flat["model_params"]
 
     def model_endpoint(self) -> str:
         """Returns the endpoint to use for the model"""
-        return self._model_config.get(self.MODEL_ENDPOINT_KEY, None)
+        return self._flat["model_endpoint"]
 
     def confidence(self) -> bool:
         """Returns true if the model is able to return a confidence score along with its predictions"""
-        return self._model_config.get(self.COMPUTE_CONFIDENCE_KEY, False)
+        return self._flat["confidence"]
 
     def logit_bias(self) -> float:
         """Returns the logit bias for the labels specified in the config"""
-        return self._model_config.get(self.LOGIT_BIAS_KEY, 0.0)
+        return self._flat["logit_bias"]
 
     # Embedding config
     def embedding_provider(self) -> str:
         """Returns the name of the entity that provides the model used for computing embeddings"""
-        return self._embedding_config.get(self.EMBEDDING_PROVIDER_KEY, self.provider())
+        return self._flat["embedding_provider"]
 
     def embedding_model_name(self) -> str:
         """Returns the name of the model being used for computing embeddings (e.g. sentence-transformers/all-mpnet-base-v2)"""
-        return self._embedding_config.get(self.EMBEDDING_MODEL_NAME_KEY, None)
+        return self._flat["embedding_model_name"]
 
     # Prompt config
     def task_guidelines(self) -> str:
-        return self._prompt_config.get(self.TASK_GUIDELINE_KEY, "")
+        return self._flat["task_guidelines"]
 
     def labels_list(self) -> List[str]:
         """Returns a list of valid labels"""
-        if isinstance(self._prompt_config.get(self.VALID_LABELS_KEY, []), List):
-            return self._prompt_config.get(self.VALID_LABELS_KEY, [])
-        else:
-            return list(self._prompt_config.get(self.VALID_LABELS_KEY, {}).keys())
+        return self._flat["labels_list"]
 
     def label_descriptions(self) -> Dict[str, str]:
         """Returns a dict of label descriptions"""
-        if isinstance(self._prompt_config.get(self.VALID_LABELS_KEY, []), List):
-            return None
-        else:
-            return self._prompt_config.get(self.VALID_LABELS_KEY, {})
+        return self._flat["label_descriptions"]
 
     def few_shot_example_set(self) -> Union[str, List]:
         """Returns examples of how data should be labeled, used to guide context to the model about the task it is performing"""
-        return self._prompt_config.get(self.FEW_SHOT_EXAMPLE_SET_KEY, [])
+        return self._flat["few_shot_example_set"]
 
     def few_shot_algorithm(self) -> str:
         """Returns which algorithm is being used to construct the set of examples being given to the model about the labeling task"""
-        return self._prompt_config.get(self.FEW_SHOT_SELECTION_ALGORITHM_KEY, None)
+        return self._flat["few_shot_algorithm"]
 
     def few_shot_num_examples(self) -> int:
         """Returns how many examples should be given to the model in its instruction prompt"""
-        return self._prompt_config.get(self.FEW_SHOT_NUM_KEY, 0)
+        return self._flat["few_shot_num_examples"]
 
     def vector_store_params(self) -> Dict:
         """Returns any parameters to be passed to the vector store"""
-        return self._prompt_config.get(self.VECTOR_STORE_PARAMS_KEY, {})
+        return self._flat["vector_store_params"]
 
     def example_template(self) -> str:
         """Returns a string containing a template for how examples will be formatted in the prompt"""
-        example_template = self._prompt_config.get(self.EXAMPLE_TEMPLATE_KEY, None)
+        example_template = self._flat["example_template"]
         if not example_template:
             raise ValueError("An example template needs to be specified in the config.")
         return example_template
 
     def output_format(self) -> str:
-        return self._prompt_config.get(self.OUTPUT_FORMAT_KEY, None)
+        return self._flat["output_format"]
 
     def output_guidelines(self) -> str:
-        return self._prompt_config.get(self.OUTPUT_GUIDELINE_KEY, None)
+        return self._flat["output_guidelines"]
 
     def chain_of_thought(self) -> bool:
         """Returns true if the model is able to perform chain of thought reasoning."""
-        return self._prompt_config.get(self.CHAIN_OF_THOUGHT_KEY, False)
+        return self._flat["chain_of_thought"]
 
     def label_selection(self) -> bool:
         """Returns true if label selection is enabled. Label selection is the process of
         narrowing down the list of possible labels by similarity to a given input. Useful for
         classification tasks with a large number of possible classes."""
-        return self._prompt_config.get(self.LABEL_SELECTION_KEY, False)
+        return self._flat["label_selection"]
 
     def max_selected_labels(self) -> int:
         """Returns the number of labels to select in LabelSelector"""
-        k = self._prompt_config.get(self.LABEL_SELECTION_COUNT_KEY, 10)
-        if k < 1:
-            return len(self.labels_list())
-        return k
+        return self._flat["max_selected_labels"]
 
     def label_selection_threshold(self) -> float:
         """Returns the threshold for label selection in LabelSelector
         If the similarity score ratio with the top Score is above this threshold,
         the label is selected."""
-        return self._prompt_config.get(self.LABEL_SELECTION_THRESHOLD, 0.0)
+        return self._flat["label_selection_threshold"]
 
     def attributes(self) -> List[Dict]:
         """Returns a list of attributes to extract from the text."""
-        return self._prompt_config.get(self.ATTRIBUTES_KEY, [])
+        return self._flat["attributes"]
 
     def transforms(self) -> List[Dict]:
         """Returns a list of transforms to apply to the data before sending to the model."""
-        return self.config.get(self.TRANSFORM_KEY, [])
+        return self._flat["transforms"]
 
     def dataset_generation_guidelines(self) -> str:
         """Returns a string containing guidelines for how to generate a synthetic dataset"""
-        return self._dataset_generation_config.get(
-            self.DATASET_GENERATION_GUIDELINES_KEY, ""
-        )
+        return self._flat["dataset_generation_guidelines"]
 
     def dataset_generation_num_rows(self) -> int:
         """Returns the number of rows to generate for the synthetic dataset"""
-        return self._dataset_generation_config.get(
-            self.DATASET_GENERATION_NUM_ROWS_KEY, 1
-        )
+        return self._flat["dataset_generation_num_rows"]
 
     def confidence_chunk_column(self) -> str:
         """Returns the column name to use for confidence chunking"""
-        return self._chunking_config.get(self.CONFIDENCE_CHUNK_COLUMN_KEY)
+        return self._flat["confidence_chunk_column"]
 
     def confidence_chunk_size(self) -> int:
         """Returns the chunk size for confidence chunking"""
-        return self._chunking_config.get(self.CONFIDENCE_CHUNK_SIZE_KEY, 3400)
+        return self._flat["confidence_chunk_size"]
 
     def confidence_merge_function(self) -> str:
         """Returns the function to use when merging confidence scores"""
-        return self._chunking_config.get(self.CONFIDENCE_MERGE_FUNCTION_KEY, "max")
+        return self._flat["confidence_merge_function"]
 
     def json_mode(self) -> bool:
         """Returns true if the model should be used in json mode. Currently only used for OpenAI models."""
-        return self._model_config.get(self.JSON_MODE, False)
+        return self._flat["json_mode"]
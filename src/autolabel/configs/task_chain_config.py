@@ -1,13 +1,14 @@
 from typing import Dict, List, Union
 
-from jsonschema import validate
-
 from .base import BaseConfig
+from .config import _validate_config
 
 
 class TaskChainConfig(BaseConfig):
     """Class to parse and store configs for Task Chain"""
 
+    __slots__ = ()
+
     # Top-level config keys
     TASK_NAME_KEY = "task_name"
     TASK_TYPE_KEY = "task_type"
@@ -18,13 +19,8 @@ class TaskChainConfig(BaseConfig):
 
     def _validate(self) -> bool:
         """Returns true if the config settings are valid"""
-        from autolabel.configs.schema import schema
-
         for subtask in self.subtasks():
-            validate(
-                instance=subtask,
-                schema=schema,
-            )
+            _validate_config(subtask)
         return True
 
     def task_name(self) -> str:
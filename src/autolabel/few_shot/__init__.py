@@ -63,7 +63,7 @@ class ExampleSelectorFactory:
             return None
 
         num_examples = config.few_shot_num_examples()
-        params = config.vector_store_params()
+        params = dict(config.vector_store_params())
         params["examples"] = examples
         params["k"] = num_examples
         if algorithm in [
@@ -65,11 +65,8 @@ class MistralLLM(BaseModel):
         self.model_name = config.model_name() or self.DEFAULT_MODEL
         self.prompts2tokens = {}
         # populate model params
-        model_params = config.model_params()
-        self.timeout = self.DEFAULT_READ_TIMEOUT
-        if "request_timeout" in model_params.keys():
-            self.timeout = model_params["request_timeout"]
-            del model_params["request_timeout"]
+        model_params = {**config.model_params()}
+        self.timeout = model_params.pop("request_timeout", self.DEFAULT_READ_TIMEOUT)
         self.model_params = {**self.DEFAULT_PARAMS, **model_params}
         self.url = "https://api.mistral.ai/v1/chat/completions"
 
@@ -323,7 +323,7 @@ def print_table(
     data = {
         str(key): (
             [str(maybe_round(v)) for v in value]
-            if isinstance(value, List)
+            if isinstance(value, list)
             else [str(maybe_round(value))]
         )
         for key, value in data.items()
@@ -1,10 +1,17 @@
 """Test Configuration"""
 
+import copy
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
 import pytest
 from jsonschema import validate, exceptions
 from autolabel import LabelingAgent
 from autolabel.configs.schema import schema
-from autolabel.configs import AutolabelConfig
+from autolabel.configs import AutolabelConfig, TaskChainConfig
+from autolabel.configs import config as config_module
 
 
 CONFIG_SAMPLE_DICT = {
@@ -109,3 +116,237 @@ def test_schema_validation():
         instance=CONFIG_SAMPLE_DICT,
         schema=schema,
     )
+
+
+def test_config_validation_error():
+    """AutolabelConfig surfaces schema failures as jsonschema ValidationErrors"""
+    config_dict_copy = CONFIG_SAMPLE_DICT.copy()
+    config_dict_copy["task_type"] = "not_supported_task_type"
+    with pytest.raises(exceptions.ValidationError):
+        AutolabelConfig(config_dict_copy)
+
+    config = AutolabelConfig(CONFIG_SAMPLE_DICT)
+    assert config.task_type() == "classification"
+
+
+def test_config_validation_with_fastjsonschema(monkeypatch, mocker):
+    """The compiled fastjsonschema validator short-circuits valid configs, and
+    jsonschema decides and reports everything it rejects"""
+    pytest.importorskip("fastjsonschema")
+    monkeypatch.setattr("autolabel.configs.config.jsonschema_rs", None)
+    compiled_validator = mocker.spy(config_module, "_get_compiled_validator")
+
+    AutolabelConfig(copy.deepcopy(CONFIG_SAMPLE_DICT))
+    assert compiled_validator.call_count == 1
+
+    config_dict_copy = copy.deepcopy(CONFIG_SAMPLE_DICT)
+    del config_dict_copy["model"]
+    with pytest.raises(
+        exceptions.ValidationError, match=r"'model' is a required property"
+    ) as e:
+        AutolabelConfig(config_dict_copy)
+    assert e.value.validator == "required"
+    assert compiled_validator.call_count == 2
+
+    # fastjsonschema rejects numpy scalars that jsonschema accepts
+    config_dict_copy = copy.deepcopy(CONFIG_SAMPLE_DICT)
+    config_dict_copy["prompt"]["few_shot_num"] = np.int64(3)
+    AutolabelConfig(config_dict_copy)
+
+    # fastjsonschema accepts tuples as arrays, jsonschema does not
+    config_dict_copy = copy.deepcopy(CONFIG_SAMPLE_DICT)
+    config_dict_copy["prompt"]["labels"] = ("toxic", "not toxic")
+    with pytest.raises(exceptions.ValidationError):
+        AutolabelConfig(config_dict_copy)
+
+
+def test_config_validation_with_jsonschema_rs(mocker):
+    """The jsonschema-rs validator short-circuits valid configs, and jsonschema
+    decides and reports everything it rejects"""
+    pytest.importorskip("jsonschema_rs")
+    native_validator = mocker.spy(config_module, "_get_native_validator")
+    compiled_validator = mocker.spy(config_module, "_get_compiled_validator")
+
+    AutolabelConfig(copy.deepcopy(CONFIG_SAMPLE_DICT))
+    assert native_validator.call_count == 1
+
+    config_dict_copy = copy.deepcopy(CONFIG_SAMPLE_DICT)
+    del config_dict_copy["model"]
+    with pytest.raises(
+        exceptions.ValidationError, match=r"'model' is a required property"
+    ) as e:
+        AutolabelConfig(config_dict_copy)
+    assert e.value.validator == "required"
+    assert native_validator.call_count == 2
+
+    # jsonschema-rs raises a plain ValueError for types it cannot convert
+    config_dict_copy = copy.deepcopy(CONFIG_SAMPLE_DICT)
+    config_dict_copy["prompt"]["few_shot_num"] = np.int64(3)
+    AutolabelConfig(config_dict_copy)
+    assert native_validator.call_count == 3
+    assert compiled_validator.call_count == 0
+
+
+def test_config_validation_without_accelerators(monkeypatch):
+    """Validation falls back to the cached jsonschema validator"""
+    monkeypatch.setattr("autolabel.configs.config.jsonschema_rs", None)
+    monkeypatch.setattr("autolabel.configs.config.fastjsonschema", None)
+    config_dict_copy = CONFIG_SAMPLE_DICT.copy()
+    del config_dict_copy["model"]
+    with pytest.raises(
+        exceptions.ValidationError,
+        match=r"'model' is a required property",
+    ):
+        AutolabelConfig(config_dict_copy)
+
+    config = AutolabelConfig(CONFIG_SAMPLE_DICT)
+    assert config.task_type() == "classification"
+
+
+def test_label_selection():
+    """Label selection settings are read once and normalized"""
+    config = AutolabelConfig(CONFIG_SAMPLE_DICT)
+    assert config.label_selection() is False
+    assert config.max_selected_labels() == 10
+
+    config_dict_copy = copy.deepcopy(CONFIG_SAMPLE_DICT)
+    config_dict_copy["prompt"]["label_selection"] = None
+    config_dict_copy["prompt"]["label_selection_count"] = 0
+    config = AutolabelConfig(config_dict_copy)
+    assert config.label_selection() is False
+    assert config.max_selected_labels() == 2
+
+
+def test_config_validated_once(monkeypatch):
+    """A config dict that already passed validation is not validated again"""
+    config_dict_copy = copy.deepcopy(CONFIG_SAMPLE_DICT)
+    AutolabelConfig(config_dict_copy)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("config should not be revalidated")
+
+    monkeypatch.setattr("autolabel.configs.config.jsonschema_rs", None)
+    monkeypatch.setattr("autolabel.configs.config.fastjsonschema", None)
+    monkeypatch.setattr("autolabel.configs.config._schema_validator", fail)
+    config = AutolabelConfig(config_dict_copy)
+    assert config.task_type() == "classification"
+
+
+def test_config_getters():
+    """Getters return default-resolved values computed at construction"""
+    config_dict_copy = copy.deepcopy(CONFIG_SAMPLE_DICT)
+    config_dict_copy["prompt"]["labels"] = {
+        "toxic": "Comment is toxic",
+        "not toxic": "Comment is not toxic",
+    }
+    config = AutolabelConfig(config_dict_copy)
+    assert config.labels_list() == ["toxic", "not toxic"]
+    assert config.label_descriptions() == config_dict_copy["prompt"]["labels"]
+    assert config.label_separator() == ";"
+    assert config.model_params() == {}
+    assert config.embedding_provider() == "openai"
+    assert config.confidence_merge_function() == "max"
+
+    del config_dict_copy["model"]
+    config = AutolabelConfig(config_dict_copy, validate=False)
+    assert config.embedding_provider() is None
+    with pytest.raises(KeyError):
+        config.provider()
+
+
+def test_config_file_cached(tmp_path):
+    """Config files are parsed once until they are modified"""
+    config_path = tmp_path / "config.json"
+    config_path.write_text(json.dumps(CONFIG_SAMPLE_DICT))
+    config0 = AutolabelConfig(str(config_path))
+    config1 = AutolabelConfig(str(config_path))
+    assert config0.config is config1.config
+
+    config_dict_copy = copy.deepcopy(CONFIG_SAMPLE_DICT)
+    config_dict_copy["task_name"] = "UpdatedTask"
+    config_path.write_text(json.dumps(config_dict_copy))
+    mtime = os.path.getmtime(config_path)
+    os.utime(config_path, (mtime + 1, mtime + 1))
+    config2 = AutolabelConfig(str(config_path))
+    assert config2.task_name() == "UpdatedTask"
+
+
+def test_config_slots():
+    """AutolabelConfig instances do not carry a per-instance __dict__"""
+    config = AutolabelConfig(CONFIG_SAMPLE_DICT)
+    assert not hasattr(config, "__dict__")
+    with pytest.raises(AttributeError):
+        config.unknown_attribute = True
+
+
+def test_task_chain_config_validation():
+    """Each subtask of a task chain is validated against the config schema"""
+    subtask = copy.deepcopy(CONFIG_SAMPLE_DICT)
+    config = TaskChainConfig(
+        {"task_name": "Chain", "task_type": "task_chain", "subtasks": [subtask]}
+    )
+    assert config.subtasks() == [subtask]
+
+    invalid_subtask = copy.deepcopy(CONFIG_SAMPLE_DICT)
+    del invalid_subtask["prompt"]
+    with pytest.raises(exceptions.ValidationError):
+        TaskChainConfig({"task_name": "Chain", "subtasks": [subtask, invalid_subtask]})
+
+
+def test_config_from_path(tmp_path):
+    """from_path returns a shared config until the file is modified"""
+    config_path = tmp_path / "config.json"
+    config_path.write_text(json.dumps(CONFIG_SAMPLE_DICT))
+    config0 = AutolabelConfig.from_path(str(config_path))
+    assert AutolabelConfig.from_path(str(config_path)) is config0
+    assert config0.task_name() == "ToxicCommentClassification"
+
+    config_dict_copy = copy.deepcopy(CONFIG_SAMPLE_DICT)
+    config_dict_copy["task_name"] = "UpdatedTask"
+    config_path.write_text(json.dumps(config_dict_copy))
+    mtime = os.path.getmtime(config_path)
+    os.utime(config_path, (mtime + 1, mtime + 1))
+    config1 = AutolabelConfig.from_path(str(config_path))
+    assert config1 is not config0
+    assert config1.task_name() == "UpdatedTask"
+
+
+def test_config_file_cache_relative_path(tmp_path, monkeypatch):
+    """Relative config paths are cached by their absolute location"""
+    for task_name in ("FirstTask", "SecondTask"):
+        config_dir = tmp_path / task_name
+        config_dir.mkdir()
+        config_dict_copy = copy.deepcopy(CONFIG_SAMPLE_DICT)
+        config_dict_copy["task_name"] = task_name
+        (config_dir / "config.json").write_text(json.dumps(config_dict_copy))
+        os.utime(config_dir / "config.json", (0, 0))
+
+    monkeypatch.chdir(tmp_path / "FirstTask")
+    assert AutolabelConfig("config.json").task_name() == "FirstTask"
+    monkeypatch.chdir(tmp_path / "SecondTask")
+    assert AutolabelConfig("config.json").task_name() == "SecondTask"
+
+
+def test_config_from_relative_path(tmp_path, monkeypatch):
+    """from_path caches relative paths by their absolute location"""
+    for task_name in ("FirstTask", "SecondTask"):
+        config_dir = tmp_path / task_name
+        config_dir.mkdir()
+        config_dict_copy = copy.deepcopy(CONFIG_SAMPLE_DICT)
+        config_dict_copy["task_name"] = task_name
+        (config_dir / "config.json").write_text(json.dumps(config_dict_copy))
+        os.utime(config_dir / "config.json", (0, 0))
+
+    monkeypatch.chdir(tmp_path / "FirstTask")
+    assert AutolabelConfig.from_path("config.json").task_name() == "FirstTask"
+    monkeypatch.chdir(tmp_path / "SecondTask")
+    assert AutolabelConfig.from_path("config.json").task_name() == "SecondTask"
+
+
+def test_config_validated_concurrently():
+    """Building configs from many threads does not fail while evicting entries"""
+    config_dicts = [copy.deepcopy(CONFIG_SAMPLE_DICT) for _ in range(512)]
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        configs = list(executor.map(AutolabelConfig, config_dicts))
+    assert all(config.task_type() == "classification" for config in configs)
+    assert len(config_module._VALIDATED_CONFIGS) <= 128